@@ -1,17 +1,25 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Iterator, Tuple, List, Optional, Union
 
 try:
     import winreg  # type: ignore
 except ImportError:  # pragma: no cover - winreg unavailable on non-Windows
     winreg = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional faster JSON backend
+    orjson = None
+
 from pathvalidate import sanitize_filename
 
 # Araxis key prefixes
@@ -27,25 +35,36 @@ K_CASE = "keywords7.*."
 K_KW3 = "keywords8.*."
 K_LEXER = "lexer.*."
 
+# Prefixes keyed by UUID vs. by pattern key suffix
+UUID_KEY_PREFIXES = (K_FILE_PATTERNS, K_DESC)
+SUFFIX_KEY_PREFIXES = (K_KW1, K_KW2, K_KW3, K_OPS, K_SL, K_ML_START, K_ML_END, K_CASE, K_LEXER)
+
 REG_BASE_SUBKEY = r"SOFTWARE\Araxis\Merge"
 REG_VALUE_NAME = "SyntaxHighlightingGeneric"
 
+# ASCII bytes other than [A-Za-z0-9], deleted via bytes.translate
+_NON_ALNUM_BYTES = bytes(b for b in range(128) if not chr(b).isalnum())
+_VERSION_SPLIT_RE = re.compile(r"(\d+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class BlobLocation:
     kind: str  # "file" or "registry"
     path: Optional[Path] = None
     version: Optional[str] = None
+    handle: Optional[object] = None  # open registry key shared by a read + write
 
+@functools.lru_cache(maxsize=4096)
 def pattern_to_key_suffix(filename_pattern: str) -> str:
-    parts = filename_pattern.split(";")
-    if parts:
-        p0 = parts[0]
-        if p0.startswith("*."):
-            parts[0] = p0[2:]
-        elif p0.startswith("*"):
-            parts[0] = p0[1:]
-    return ";".join(parts)
+    # Only the first ';'-separated token loses its leading "*." or "*", and that
+    # token starts the string, so stripping the whole string's prefix is equivalent
+    if filename_pattern.startswith("*."):
+        suffix = filename_pattern[2:]
+    elif filename_pattern.startswith("*"):
+        suffix = filename_pattern[1:]
+    else:
+        suffix = filename_pattern
+    return suffix
 
 
 def _require_winreg() -> None:
@@ -53,8 +72,9 @@ def _require_winreg() -> None:
         raise SystemExit("Registry access is only supported on Windows (winreg module not available).")
 
 
+@functools.lru_cache(maxsize=256)
 def _version_sort_key(version: str) -> Tuple:
-    parts = re.split(r"(\d+)", version)
+    parts = _VERSION_SPLIT_RE.split(version)
     key = []
     for part in parts:
         if not part:
@@ -66,7 +86,9 @@ def _version_sort_key(version: str) -> Tuple:
     return tuple(key)
 
 
-def _list_registry_versions() -> List[str]:
+@functools.lru_cache(maxsize=1)
+def _list_registry_versions() -> Tuple[str, ...]:
+    # Tuple, since the cached value is shared by every caller
     _require_winreg()
     try:
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_BASE_SUBKEY) as key:
@@ -79,16 +101,24 @@ def _list_registry_versions() -> List[str]:
                 except OSError:
                     break
     except FileNotFoundError:
-        return []
-    return versions
+        return ()
+    return tuple(versions)
 
 
-def _read_registry_blob(version: str) -> str:
+def _open_registry_key(version: str, access: int) -> "winreg.HKEYType":
     _require_winreg()
     subkey = f"{REG_BASE_SUBKEY}\\{version}"
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey) as key:
-            value, reg_type = winreg.QueryValueEx(key, REG_VALUE_NAME)
+        return winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey, 0, access)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(
+            f"Araxis Merge registry entry not found for version '{version}'."
+        ) from exc
+
+
+def _read_with_handle(key: "winreg.HKEYType", version: str) -> str:
+    try:
+        value, reg_type = winreg.QueryValueEx(key, REG_VALUE_NAME)
     except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"Araxis Merge registry entry not found for version '{version}'."
@@ -104,18 +134,44 @@ def _read_registry_blob(version: str) -> str:
     return value
 
 
-def _write_registry_blob(version: str, text: str) -> None:
-    _require_winreg()
-    subkey = f"{REG_BASE_SUBKEY}\\{version}"
+def _write_with_handle(key: "winreg.HKEYType", version: str, text: str) -> None:
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_SET_VALUE) as key:
-            winreg.SetValueEx(key, REG_VALUE_NAME, 0, winreg.REG_SZ, text)
+        winreg.SetValueEx(key, REG_VALUE_NAME, 0, winreg.REG_SZ, text)
     except FileNotFoundError as exc:
         raise FileNotFoundError(
             f"Araxis Merge registry entry not found for version '{version}'."
         ) from exc
 
 
+def _read_registry_blob(version: str) -> str:
+    _require_winreg()
+    with _open_registry_key(version, winreg.KEY_READ) as key:
+        return _read_with_handle(key, version)
+
+
+def _write_registry_blob(version: str, text: str) -> None:
+    _require_winreg()
+    with _open_registry_key(version, winreg.KEY_SET_VALUE) as key:
+        _write_with_handle(key, version, text)
+
+
+@contextmanager
+def open_for_update(location: BlobLocation) -> Iterator[BlobLocation]:
+    # For registry locations, open the subkey once for both the read and the
+    # write of a read-modify-write cycle. Files need no shared state.
+    if location.kind != "registry":
+        yield location
+        return
+    assert location.version is not None
+    _require_winreg()
+    with _open_registry_key(location.version, winreg.KEY_READ | winreg.KEY_SET_VALUE) as key:
+        location.handle = key
+        try:
+            yield location
+        finally:
+            location.handle = None
+
+
 def parse_blob_location(spec: str) -> BlobLocation:
     spec = spec.strip()
     lower_spec = spec.lower()
@@ -134,28 +190,33 @@ def parse_blob_location(spec: str) -> BlobLocation:
                 raise SystemExit(
                     f"No Araxis Merge registry versions found under HKCU\\{REG_BASE_SUBKEY}."
                 )
-            version = sorted(versions, key=_version_sort_key, reverse=True)[0]
+            version = max(versions, key=_version_sort_key)
         return BlobLocation(kind="registry", version=version)
     return BlobLocation(kind="file", path=Path(spec))
 
 
-def read_blob_text(location: BlobLocation) -> str:
+def read_blob_bytes(location: BlobLocation) -> bytes:
     if location.kind == "file":
         assert location.path is not None
-        return read_text(location.path)
+        return location.path.read_bytes()
     assert location.version is not None
-    return _read_registry_blob(location.version)
+    if location.handle is not None:
+        return _read_with_handle(location.handle, location.version).encode("utf-8")
+    return _read_registry_blob(location.version).encode("utf-8")
 
 
-def write_blob_text(location: BlobLocation, text: str) -> None:
+def write_blob_bytes(location: BlobLocation, data: bytes) -> None:
     if location.kind == "file":
         assert location.path is not None
-        write_text(location.path, text)
+        write_bytes(location.path, data)
         return
     assert location.version is not None
-    _write_registry_blob(location.version, text)
+    if location.handle is not None:
+        _write_with_handle(location.handle, location.version, data.decode("utf-8"))
+        return
+    _write_registry_blob(location.version, data.decode("utf-8"))
 
-@dataclass
+@dataclass(slots=True)
 class Language:
     uuid: str
     name: str
@@ -174,20 +235,19 @@ class Language:
     @staticmethod
     def from_flat(uuid: str, file_patterns: str, flat: Dict[str, str]) -> "Language":
         name = flat.get(K_DESC + uuid, "")
-        fp = file_patterns
+        suffix = pattern_to_key_suffix(file_patterns)
         # Helper to fetch keys using normalized suffix
         def get(k_prefix: str) -> str:
-            return flat.get(k_prefix + pattern_to_key_suffix(fp), "")
+            return flat.get(k_prefix + suffix, "")
         # Parse case sensitivity and backslash escape (keywords7)
         case_raw = get(K_CASE).strip()
         is_case = "false"
         backslash_escape = True
         if case_raw:
-            parts = case_raw.split()
-            if parts:
-                val = parts[0].lower()
-                if val in ("true", "false"):
-                    is_case = val
+            # Only the first token matters; case_raw is stripped and non-empty
+            val = case_raw.split(None, 1)[0].lower()
+            if val in ("true", "false"):
+                is_case = val
             if "no_backslash_escape" in case_raw:
                 backslash_escape = False
         return Language(
@@ -206,19 +266,48 @@ class Language:
             lexer=get(K_LEXER) or "generic",
         )
 
-def read_text(path: Path) -> str:
-    with path.open("r", encoding="utf-8") as f:
-        return f.read()
+# Field names in declaration order; all values are primitives, so a shallow
+# dict of these is equivalent to asdict() without the recursive copy
+LANGUAGE_FIELDS = tuple(f.name for f in fields(Language))
+
+def json_loads(data: Union[bytes, memoryview]) -> object:
+    # Parse UTF-8 JSON bytes directly, using orjson when it is installed
+    if orjson is not None:
+        return orjson.loads(data)
+    # Decode explicitly: json.loads(bytes) would sniff BOMs/UTF-16/32, which
+    # orjson (and plain UTF-8 decoding) rejects
+    return json.loads(bytes(data).decode("utf-8"))
+
+def json_dumps(obj: object, indent: bool = False) -> bytes:
+    # Serialize to UTF-8 JSON bytes: indent=2 when pretty, otherwise compact
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_file(path: Path, data: bytes) -> None:
+    # Raw unbuffered write; the caller is responsible for the parent directory
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-def write_text(path: Path, text: str) -> None:
+def write_bytes(path: Path, data: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
-        f.write(text)
+    write_file(path, data)
 
 def load_json_with_optional_header(source: BlobLocation) -> Dict[str, str]:
-    raw = read_blob_text(source)
-    i = raw.find("{")
-    data = json.loads(raw[i:] if i >= 0 else raw)
+    return parse_araxis_json(read_blob_bytes(source))
+
+def parse_araxis_json(raw: bytes) -> Dict[str, str]:
+    # Skip an optional "json: " header without copying the (possibly multi-MB) body
+    i = raw.find(b"{")
+    data = json_loads(memoryview(raw)[i:] if i > 0 else raw)
     if not isinstance(data, dict):
         raise SystemExit("Top-level JSON must be an object.")
     # Coerce to str->str
@@ -229,80 +318,85 @@ def load_json_with_optional_header(source: BlobLocation) -> Dict[str, str]:
         out[k] = v
     return out
 
-def dump_araxis_json(flat: Dict[str, str], destination: BlobLocation, no_header: bool) -> None:
+def encode_araxis_json(flat: Dict[str, str], no_header: bool) -> bytes:
     if no_header:
-        txt = json.dumps(flat, ensure_ascii=False, indent=2)
-    else:
-        txt = "json: " + json.dumps(flat, ensure_ascii=False, separators=(",", ":"))
-    write_blob_text(destination, txt)
+        return json_dumps(flat, indent=True)
+    return b"json: " + json_dumps(flat)
+
+def dump_araxis_json(flat: Dict[str, str], destination: BlobLocation, no_header: bool) -> None:
+    write_blob_bytes(destination, encode_araxis_json(flat, no_header))
 
 def parse_languages_from_flat(flat: Dict[str, str]) -> Tuple[Dict[str, Language], Dict[str, str]]:
     uuid_to_lang: Dict[str, Language] = {}
     pattern_to_uuid: Dict[str, str] = {}
+    n = len(K_FILE_PATTERNS)
     for k, v in flat.items():
         if k.startswith(K_FILE_PATTERNS):
-            uuid = k[len(K_FILE_PATTERNS):]
+            uuid = k[n:]
             lang = Language.from_flat(uuid, v, flat)
             uuid_to_lang[uuid] = lang
             if lang.filenamePattern:
                 pattern_to_uuid[lang.filenamePattern] = uuid
     return uuid_to_lang, pattern_to_uuid
 
+def add_language_to_flat(flat: Dict[str, str], L: Language) -> None:
+    flat[K_FILE_PATTERNS + L.uuid] = L.filenamePattern
+    flat[K_DESC + L.uuid] = L.name
+    suffix = pattern_to_key_suffix(L.filenamePattern)
+    flat[K_KW1 + suffix] = L.keywordsClass1
+    flat[K_KW2 + suffix] = L.keywordsClass2
+    flat[K_KW3 + suffix] = L.keywordsClass3
+    flat[K_OPS + suffix] = L.operatorSymbols
+    flat[K_SL + suffix] = L.singleLineCommentSymbols
+    flat[K_ML_START + suffix] = L.multiLineCommentStartSymbols
+    flat[K_ML_END + suffix] = L.multiLineCommentEndSymbols
+    # Build keywords7 value: "<true|false>" optionally followed by " no_backslash_escape"
+    case_val = (L.isCaseSensitive.lower().strip() if L.isCaseSensitive else "false")
+    if L.backslashIsAStringEscape is False:
+        flat[K_CASE + suffix] = f"{case_val} no_backslash_escape"
+    else:
+        flat[K_CASE + suffix] = case_val
+    flat[K_LEXER + suffix] = L.lexer or "generic"
+
 def build_flat_from_languages(langs: List[Language]) -> Dict[str, str]:
     flat: Dict[str, str] = {}
     for L in langs:
-        flat[K_FILE_PATTERNS + L.uuid] = L.filenamePattern
-        flat[K_DESC + L.uuid] = L.name
-        suffix = pattern_to_key_suffix(L.filenamePattern)
-        flat[K_KW1 + suffix] = L.keywordsClass1
-        flat[K_KW2 + suffix] = L.keywordsClass2
-        flat[K_KW3 + suffix] = L.keywordsClass3
-        flat[K_OPS + suffix] = L.operatorSymbols
-        flat[K_SL + suffix] = L.singleLineCommentSymbols
-        flat[K_ML_START + suffix] = L.multiLineCommentStartSymbols
-        flat[K_ML_END + suffix] = L.multiLineCommentEndSymbols
-        # Build keywords7 value: "<true|false>" optionally followed by " no_backslash_escape"
-        case_val = (L.isCaseSensitive.lower().strip() if L.isCaseSensitive else "false")
-        if L.backslashIsAStringEscape is False:
-            flat[K_CASE + suffix] = f"{case_val} no_backslash_escape"
-        else:
-            flat[K_CASE + suffix] = case_val
-        flat[K_LEXER + suffix] = L.lexer or "generic"
+        add_language_to_flat(flat, L)
     return flat
 
+def load_language_file(p: Path) -> Language:
+    obj = json_loads(p.read_bytes())
+    required = ["uuid", "name", "filenamePattern", "isCaseSensitive", "lexer"]
+    for r in required:
+        if r not in obj:
+            raise SystemExit(f"Missing required field '{r}' in {p.name}")
+    backslash = obj.get("backslashIsAStringEscape", True)
+    # Allow JSON true/false or string forms
+    if isinstance(backslash, str):
+        backslash = backslash.lower() in ("true", "1", "yes")
+    L = Language(
+        uuid=str(obj.get("uuid","")),
+        name=str(obj.get("name","")),
+        filenamePattern=str(obj.get("filenamePattern","")),
+        keywordsClass1=str(obj.get("keywordsClass1","")),
+        keywordsClass2=str(obj.get("keywordsClass2","")),
+        keywordsClass3=str(obj.get("keywordsClass3","")),
+        operatorSymbols=str(obj.get("operatorSymbols","")),
+        singleLineCommentSymbols=str(obj.get("singleLineCommentSymbols","")),
+        multiLineCommentStartSymbols=str(obj.get("multiLineCommentStartSymbols","")),
+        multiLineCommentEndSymbols=str(obj.get("multiLineCommentEndSymbols","")),
+        isCaseSensitive=str(obj.get("isCaseSensitive","false")).lower(),
+        backslashIsAStringEscape=bool(backslash),
+        lexer=str(obj.get("lexer","generic")) or "generic",
+    )
+    if L.isCaseSensitive not in ("true","false"):
+        raise SystemExit(f"isCaseSensitive must be 'true' or 'false' in {p.name}")
+    if not L.filenamePattern:
+        raise SystemExit(f"filenamePattern must be non-empty in {p.name}")
+    return L
+
 def load_languages_from_dir(indir: Path) -> List[Language]:
-    langs: List[Language] = []
-    for p in sorted(indir.glob("*.json")):
-        obj = json.loads(p.read_text(encoding="utf-8"))
-        required = ["uuid", "name", "filenamePattern", "isCaseSensitive", "lexer"]
-        for r in required:
-            if r not in obj:
-                raise SystemExit(f"Missing required field '{r}' in {p.name}")
-        backslash = obj.get("backslashIsAStringEscape", True)
-        # Allow JSON true/false or string forms
-        if isinstance(backslash, str):
-            backslash = backslash.lower() in ("true", "1", "yes")
-        L = Language(
-            uuid=str(obj.get("uuid","")),
-            name=str(obj.get("name","")),
-            filenamePattern=str(obj.get("filenamePattern","")),
-            keywordsClass1=str(obj.get("keywordsClass1","")),
-            keywordsClass2=str(obj.get("keywordsClass2","")),
-            keywordsClass3=str(obj.get("keywordsClass3","")),
-            operatorSymbols=str(obj.get("operatorSymbols","")),
-            singleLineCommentSymbols=str(obj.get("singleLineCommentSymbols","")),
-            multiLineCommentStartSymbols=str(obj.get("multiLineCommentStartSymbols","")),
-            multiLineCommentEndSymbols=str(obj.get("multiLineCommentEndSymbols","")),
-            isCaseSensitive=str(obj.get("isCaseSensitive","false")).lower(),
-            backslashIsAStringEscape=bool(backslash),
-            lexer=str(obj.get("lexer","generic")) or "generic",
-        )
-        if L.isCaseSensitive not in ("true","false"):
-            raise SystemExit(f"isCaseSensitive must be 'true' or 'false' in {p.name}")
-        if not L.filenamePattern:
-            raise SystemExit(f"filenamePattern must be non-empty in {p.name}")
-        langs.append(L)
-    return langs
+    return [load_language_file(p) for p in sorted(indir.glob("*.json"))]
 
 def cmd_unpack(args: argparse.Namespace) -> None:
     input_location = parse_blob_location(args.input_file)
@@ -310,27 +404,30 @@ def cmd_unpack(args: argparse.Namespace) -> None:
     uuid_to_lang, _ = parse_languages_from_flat(flat)
     out_dir = Path(args.output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    used = set()
+    # One directory listing instead of an exists() check per language. Names are
+    # casefolded on every platform since Windows and macOS default to
+    # case-insensitive filesystems; an extra suffix elsewhere is harmless
+    used = {name.casefold() for name in os.listdir(out_dir)}
     for lang in uuid_to_lang.values():
         base = sanitize_filename(lang.name) or "unnamed"
         fname = base + ".json"
-        if fname in used or (out_dir / fname).exists():
-            suffix = "-" + re.sub(r"[^A-Za-z0-9]+", "", lang.uuid)[:8]
+        if fname.casefold() in used:
+            suffix = "-" + lang.uuid.encode("ascii", "ignore").translate(None, _NON_ALNUM_BYTES).decode("ascii")[:8]
             fname = f"{base}{suffix}.json"
-        used.add(fname)
+        used.add(fname.casefold())
         # Write the Language dataclass to disk, including backslashIsAStringEscape
-        data = asdict(lang)
-        write_text(out_dir / fname, json.dumps(data, ensure_ascii=False, indent=2))
+        data = {k: getattr(lang, k) for k in LANGUAGE_FIELDS}
+        write_file(out_dir / fname, json_dumps(data, indent=True))
     print(f"Wrote {len(uuid_to_lang)} language JSON file(s) to: {out_dir}")
 
 def cmd_pack(args: argparse.Namespace) -> None:
     langs = load_languages_from_dir(Path(args.input_dir))
     # Ensure unique filenamePattern
-    seen = {}
+    seen: Dict[str, str] = {}
     for L in langs:
-        if L.filenamePattern in seen and seen[L.filenamePattern] != L.uuid:
-            raise SystemExit(f"Duplicate filenamePattern between UUIDs {seen[L.filenamePattern]} and {L.uuid}: '{L.filenamePattern}'")
-        seen[L.filenamePattern] = L.uuid
+        prev = seen.setdefault(L.filenamePattern, L.uuid)
+        if prev != L.uuid:
+            raise SystemExit(f"Duplicate filenamePattern between UUIDs {prev} and {L.uuid}: '{L.filenamePattern}'")
     flat = build_flat_from_languages(langs)
     output_location = parse_blob_location(args.output_file)
     dump_araxis_json(flat, output_location, args.no_header)
@@ -338,39 +435,56 @@ def cmd_pack(args: argparse.Namespace) -> None:
 
 def cmd_merge(args: argparse.Namespace) -> None:
     output_location = parse_blob_location(args.output_file)
-    try:
-        target_flat = load_json_with_optional_header(output_location)
-    except FileNotFoundError:
-        target_flat = {}
-    uuid_to_lang, pattern_to_uuid = parse_languages_from_flat(target_flat)
     incoming = load_languages_from_dir(Path(args.input_dir))
-
-    def remove_lang(uuid: str) -> None:
-        fp_old = target_flat.get(K_FILE_PATTERNS + uuid, "")
-        for k in (K_FILE_PATTERNS + uuid, K_DESC + uuid):
-            target_flat.pop(k, None)
-        if fp_old:
-            suffix = pattern_to_key_suffix(fp_old)
-            for pref in (K_KW1, K_KW2, K_KW3, K_OPS, K_SL, K_ML_START, K_ML_END, K_CASE, K_LEXER):
-                target_flat.pop(pref + suffix, None)
-
-    for L in incoming:
-        uuid_exists = L.uuid in uuid_to_lang
-        conflict_uuid = pattern_to_uuid.get(L.filenamePattern)
-        if (not uuid_exists) and conflict_uuid and conflict_uuid != L.uuid:
-            raise SystemExit(
-                "Merge conflict: filenamePattern already present for another language.\n"
-                f"  Incoming UUID: {L.uuid}\n"
-                f"  Conflicting UUID: {conflict_uuid}\n"
-                f"  filenamePattern: '{L.filenamePattern}'"
-            )
-        if uuid_exists:
-            remove_lang(L.uuid)
-        uuid_to_lang[L.uuid] = L
-        pattern_to_uuid[L.filenamePattern] = L.uuid
-
-    flat_new = build_flat_from_languages(list(uuid_to_lang.values()))
-    dump_araxis_json(flat_new, output_location, args.no_header)
+    if not incoming:
+        # Nothing to upsert: skip loading and rewriting the target entirely
+        print(f"No language JSON files in {args.input_dir}; nothing merged into: {args.output_file}")
+        return
+    with open_for_update(output_location):
+        raw: Optional[bytes]
+        try:
+            raw = read_blob_bytes(output_location)
+        except FileNotFoundError:
+            raw = None
+        target_flat = parse_araxis_json(raw) if raw is not None else {}
+        uuid_to_lang, pattern_to_uuid = parse_languages_from_flat(target_flat)
+
+        def remove_lang(uuid: str) -> None:
+            fp_old = target_flat.get(K_FILE_PATTERNS + uuid, "")
+            for pref in UUID_KEY_PREFIXES:
+                target_flat.pop(pref + uuid, None)
+            if fp_old:
+                suffix = pattern_to_key_suffix(fp_old)
+                for pref in SUFFIX_KEY_PREFIXES:
+                    target_flat.pop(pref + suffix, None)
+
+        for L in incoming:
+            uuid_exists = L.uuid in uuid_to_lang
+            conflict_uuid = pattern_to_uuid.get(L.filenamePattern)
+            if (not uuid_exists) and conflict_uuid and conflict_uuid != L.uuid:
+                raise SystemExit(
+                    "Merge conflict: filenamePattern already present for another language.\n"
+                    f"  Incoming UUID: {L.uuid}\n"
+                    f"  Conflicting UUID: {conflict_uuid}\n"
+                    f"  filenamePattern: '{L.filenamePattern}'"
+                )
+            # Only drop the old keys when the pattern key suffix changes; otherwise
+            # overwriting them keeps their position, so an unchanged language
+            # re-serializes identically
+            if uuid_exists:
+                fp_old = target_flat.get(K_FILE_PATTERNS + L.uuid, "")
+                if pattern_to_key_suffix(fp_old) != pattern_to_key_suffix(L.filenamePattern):
+                    remove_lang(L.uuid)
+            # Upsert in place; languages not in the incoming set are left untouched
+            add_language_to_flat(target_flat, L)
+            uuid_to_lang[L.uuid] = L
+            pattern_to_uuid[L.filenamePattern] = L.uuid
+
+        data = encode_araxis_json(target_flat, args.no_header)
+        if data == raw:
+            print(f"Merged {len(incoming)} language(s); no changes, left as is: {args.output_file}")
+            return
+        write_blob_bytes(output_location, data)
     print(f"Merged {len(incoming)} language(s) into: {args.output_file}")
 
 def main(argv: List[str]) -> None: